@@ -1,38 +1,100 @@
 """A python client library for Google Weather API."""
 
-from .api import GoogleWeatherApi
+from importlib import import_module as _import_module
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+from typing import Any as _Any
+
 from .exceptions import (
     GoogleWeatherApiConnectionError,
     GoogleWeatherApiError,
     GoogleWeatherApiResponseError,
 )
-from .model import (
-    AirPressure,
-    CurrentConditionsHistory,
-    CurrentConditionsResponse,
-    DailyForecastResponse,
-    Date,
-    DateTime,
-    ForecastDay,
-    ForecastDayPart,
-    ForecastHour,
-    HourlyForecastResponse,
-    IceThickness,
-    Interval,
-    LocalizedText,
-    MoonEvents,
-    Precipitation,
-    PrecipitationProbability,
-    QuantitativePrecipitationForecast,
-    SunEvents,
-    Temperature,
-    TimeZone,
-    Visibility,
-    WeatherCondition,
-    Wind,
-    WindDirection,
-    WindSpeed,
-)
+
+if _TYPE_CHECKING:
+    from .api import GoogleWeatherApi
+    from .model import (
+        AirPressure,
+        CurrentConditionsHistory,
+        CurrentConditionsResponse,
+        DailyForecastResponse,
+        Date,
+        DateTime,
+        ForecastDay,
+        ForecastDayPart,
+        ForecastHour,
+        HourlyForecastResponse,
+        IceThickness,
+        Interval,
+        LazyCurrentConditionsResponse,
+        LengthUnit,
+        LocalizedText,
+        MoonEvents,
+        Precipitation,
+        PrecipitationProbability,
+        QuantitativePrecipitationForecast,
+        SunEvents,
+        Temperature,
+        TimeZone,
+        Visibility,
+        WeatherCondition,
+        Wind,
+        WindDirection,
+        WindSpeed,
+    )
+
+# The api and model modules pull in aiohttp and compile the mashumaro codecs,
+# so they are only imported when one of their names, or the module itself, is first accessed.
+_LAZY_IMPORTS = {
+    "GoogleWeatherApi": ".api",
+    "AirPressure": ".model",
+    "CurrentConditionsHistory": ".model",
+    "CurrentConditionsResponse": ".model",
+    "DailyForecastResponse": ".model",
+    "Date": ".model",
+    "DateTime": ".model",
+    "ForecastDay": ".model",
+    "ForecastDayPart": ".model",
+    "ForecastHour": ".model",
+    "HourlyForecastResponse": ".model",
+    "IceThickness": ".model",
+    "Interval": ".model",
+    "LazyCurrentConditionsResponse": ".model",
+    "LengthUnit": ".model",
+    "LocalizedText": ".model",
+    "MoonEvents": ".model",
+    "Precipitation": ".model",
+    "PrecipitationProbability": ".model",
+    "QuantitativePrecipitationForecast": ".model",
+    "SunEvents": ".model",
+    "Temperature": ".model",
+    "TimeZone": ".model",
+    "Visibility": ".model",
+    "WeatherCondition": ".model",
+    "Wind": ".model",
+    "WindDirection": ".model",
+    "WindSpeed": ".model",
+}
+
+
+_LAZY_SUBMODULES = ("api", "model")
+
+
+def __getattr__(name: str) -> _Any:
+    """Import the module defining name on first access."""
+    if name in _LAZY_SUBMODULES:
+        return _import_module(f".{name}", __name__)
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public names, including the ones not imported yet."""
+    return sorted(__all__)
+
 
 __all__ = [
     "AirPressure",
@@ -51,6 +113,8 @@ __all__ = [
     "HourlyForecastResponse",
     "IceThickness",
     "Interval",
+    "LazyCurrentConditionsResponse",
+    "LengthUnit",
     "LocalizedText",
     "MoonEvents",
     "Precipitation",
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from http import HTTPStatus
-from typing import Any
+import warnings
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import aiohttp
+import orjson
+from yarl import URL
 
 from .exceptions import (
     GoogleWeatherApiConnectionError,
@@ -16,16 +19,45 @@ from .model import (
     CurrentConditionsResponse,
     DailyForecastResponse,
     HourlyForecastResponse,
+    LazyCurrentConditionsResponse,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+_ResponseT = TypeVar("_ResponseT")
+
 _LOGGER = logging.getLogger(__name__)
 
 _BASE_URL = "https://weather.googleapis.com/v1"
+_CURRENT_CONDITIONS_URL = f"{_BASE_URL}/currentConditions:lookup"
+_HOURLY_FORECAST_URL = f"{_BASE_URL}/forecast/hours:lookup"
+_DAILY_FORECAST_URL = f"{_BASE_URL}/forecast/days:lookup"
 _USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36"
 
 
 class GoogleWeatherApi:
-    """Class to interact with the Google Weather API."""
+    """Class to interact with the Google Weather API.
+
+    Requests go through the given session, which should be long-lived and shared
+    so its connector can keep connections to the API alive instead of paying a
+    new TCP and TLS handshake on every request, e.g. a session using
+    aiohttp.TCPConnector(ttl_dns_cache=300) with the default force_close=False.
+    aiohttp already enables TCP_NODELAY on its connections.
+    """
+
+    __slots__ = (
+        "_api_key",
+        "_current_conditions_url",
+        "_daily_forecast_url",
+        "_headers",
+        "_hourly_forecast_url",
+        "_language_code",
+        "_referrer",
+        "_units_system",
+        "session",
+        "timeout",
+    )
 
     def __init__(
         self,
@@ -37,85 +69,205 @@ class GoogleWeatherApi:
         timeout: int = 10,
     ) -> None:
         """Initialize the Google Weather API client."""
+        if session.closed:
+            raise ValueError("session is closed")
+        if session.connector is not None and session.connector.force_close:
+            warnings.warn(
+                "session connector has force_close=True, connections to the API will not be reused",
+                stacklevel=2,
+            )
         self.session = session
-        self.api_key = api_key
-        self.language_code = language_code
-        self.units_system = units_system
-        self.referrer = referrer
+        self._api_key = api_key
+        self._language_code = language_code
+        self._units_system = units_system
+        self._referrer = referrer
         self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self._build_request_defaults()
+
+    def _build_request_defaults(self) -> None:
+        """Build the headers and the endpoint URLs with the constant query parameters.
 
-    async def _async_get(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
-        """Perform a GET request."""
-        url = f"{_BASE_URL}/{endpoint}"
-        headers = {aiohttp.hdrs.USER_AGENT: _USER_AGENT}
-        if self.referrer:
-            headers[aiohttp.hdrs.REFERER] = self.referrer
-        params = {
-            **params,
-            "key": self.api_key,
-            "language_code": self.language_code,
-            "units_system": self.units_system,
+        Called again whenever api_key, language_code, units_system or referrer is set.
+        """
+        self._headers = {aiohttp.hdrs.USER_AGENT: _USER_AGENT}
+        if self._referrer:
+            self._headers[aiohttp.hdrs.REFERER] = self._referrer
+        base_params = {
+            "key": self._api_key,
+            "language_code": self._language_code,
+            "units_system": self._units_system,
         }
-        _LOGGER.debug("GET %s with params: %s", url, params)
+        self._current_conditions_url = URL(_CURRENT_CONDITIONS_URL).with_query(base_params)
+        self._hourly_forecast_url = URL(_HOURLY_FORECAST_URL).with_query(base_params)
+        self._daily_forecast_url = URL(_DAILY_FORECAST_URL).with_query(base_params)
+
+    @property
+    def api_key(self) -> str:
+        """The API key sent with every request."""
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, api_key: str) -> None:
+        self._api_key = api_key
+        self._build_request_defaults()
+
+    @property
+    def language_code(self) -> str:
+        """The language code sent with every request."""
+        return self._language_code
+
+    @language_code.setter
+    def language_code(self, language_code: str) -> None:
+        self._language_code = language_code
+        self._build_request_defaults()
+
+    @property
+    def units_system(self) -> str:
+        """The units system sent with every request."""
+        return self._units_system
+
+    @units_system.setter
+    def units_system(self, units_system: str) -> None:
+        self._units_system = units_system
+        self._build_request_defaults()
+
+    @property
+    def referrer(self) -> str | None:
+        """The Referer header sent with every request, if any."""
+        return self._referrer
+
+    @referrer.setter
+    def referrer(self, referrer: str | None) -> None:
+        self._referrer = referrer
+        self._build_request_defaults()
+
+    async def _async_get_body(self, url: URL, params: dict[str, Any]) -> bytes:
+        """Perform a GET request and return the raw body of a successful response.
+
+        The url already carries the constant query parameters, params only holds the per-call ones.
+        """
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "GET %s with params: %s",
+                url.with_query(None),
+                params | dict(url.query) | {"key": "REDACTED"},
+            )
         try:
             async with self.session.get(
                 url,
                 params=params,
-                headers=headers,
+                headers=self._headers,
                 timeout=self.timeout,
             ) as resp:
-                res: dict[str, Any] = await resp.json()
-                _LOGGER.debug("Got %s for %s", resp.status, url)
-                if resp.status != HTTPStatus.OK:
-                    raise GoogleWeatherApiResponseError(res["error"]["message"])
-                return res
+                body = await resp.read()
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Got %s for %s", resp.status, url.with_query(None))
+                if resp.status != 200:
+                    try:
+                        message = orjson.loads(body)["error"]["message"]
+                    except (ValueError, KeyError, TypeError):
+                        message = None
+                    if not message or not isinstance(message, str):
+                        message = resp.reason or f"HTTP {resp.status}"
+                    raise GoogleWeatherApiResponseError(message)
         except TimeoutError as err:
             raise GoogleWeatherApiConnectionError("Timeout") from err
         except aiohttp.ClientError as err:
             raise GoogleWeatherApiConnectionError(err) from err
+        return body
+
+    async def _async_get(self, url: URL, params: dict[str, Any], decode: Callable[[bytes], _ResponseT]) -> _ResponseT:
+        """Perform a GET request and decode the response body with decode."""
+        body = await self._async_get_body(url, params)
+        try:
+            return decode(body)
+        except orjson.JSONDecodeError as err:
+            raise GoogleWeatherApiResponseError(f"Invalid JSON response: {err}") from err
 
     async def async_get_current_conditions(self, latitude: float, longitude: float) -> CurrentConditionsResponse:
         """Fetch current weather conditions.
 
         See https://developers.google.com/maps/documentation/weather/reference/rest/v1/currentConditions/lookup
         """
-        data = await self._async_get(
-            "currentConditions:lookup",
+        return await self._async_get(
+            self._current_conditions_url,
             {
                 "location.latitude": latitude,
                 "location.longitude": longitude,
             },
+            CurrentConditionsResponse.from_json,
         )
-        return CurrentConditionsResponse.from_dict(data)
+
+    async def async_get_current_conditions_lazy(self, latitude: float, longitude: float) -> LazyCurrentConditionsResponse:
+        """Fetch current weather conditions, decoding each field only when it is first accessed.
+
+        See https://developers.google.com/maps/documentation/weather/reference/rest/v1/currentConditions/lookup
+        """
+        return await self._async_get(
+            self._current_conditions_url,
+            {
+                "location.latitude": latitude,
+                "location.longitude": longitude,
+            },
+            LazyCurrentConditionsResponse,
+        )
+
+    async def async_get_current_conditions_many(
+        self, points: Iterable[tuple[float, float]], max_concurrency: int = 8
+    ) -> list[CurrentConditionsResponse]:
+        """Fetch current weather conditions for multiple (latitude, longitude) points.
+
+        At most max_concurrency requests are in flight at a time.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _async_get_one(latitude: float, longitude: float) -> CurrentConditionsResponse:
+            async with semaphore:
+                return await self.async_get_current_conditions(latitude, longitude)
+
+        return await asyncio.gather(*(_async_get_one(latitude, longitude) for latitude, longitude in points))
 
     async def async_get_hourly_forecast(self, latitude: float, longitude: float, hours: int = 48) -> HourlyForecastResponse:
         """Fetch hourly weather forecast.
 
         See https://developers.google.com/maps/documentation/weather/reference/rest/v1/forecast.hours/lookup
         """
-        data = await self._async_get(
-            "forecast/hours:lookup",
+        return await self._async_get(
+            self._hourly_forecast_url,
             {
                 "location.latitude": latitude,
                 "location.longitude": longitude,
                 "hours": hours,
                 "page_size": hours,
             },
+            HourlyForecastResponse.from_json,
         )
-        return HourlyForecastResponse.from_dict(data)
 
     async def async_get_daily_forecast(self, latitude: float, longitude: float, days: int = 10) -> DailyForecastResponse:
         """Fetch daily weather forecast.
 
         See https://developers.google.com/maps/documentation/weather/reference/rest/v1/forecast.days/lookup
         """
-        data = await self._async_get(
-            "forecast/days:lookup",
+        return await self._async_get(
+            self._daily_forecast_url,
             {
                 "location.latitude": latitude,
                 "location.longitude": longitude,
                 "days": days,
                 "page_size": days,
             },
+            DailyForecastResponse.from_json,
+        )
+
+    async def async_get_all(
+        self, latitude: float, longitude: float, hours: int = 48, days: int = 10
+    ) -> tuple[CurrentConditionsResponse, HourlyForecastResponse, DailyForecastResponse]:
+        """Fetch current conditions, hourly forecast, and daily forecast concurrently."""
+        current, hourly, daily = await asyncio.gather(
+            self.async_get_current_conditions(latitude, longitude),
+            self.async_get_hourly_forecast(latitude, longitude, hours),
+            self.async_get_daily_forecast(latitude, longitude, days),
         )
-        return DailyForecastResponse.from_dict(data)
+        return current, hourly, daily
@@ -2,55 +2,118 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from array import array
+from dataclasses import dataclass, field, fields
 from enum import StrEnum
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, TypeVar, get_type_hints
+from weakref import WeakValueDictionary
 
-from mashumaro.mixins.json import DataClassJSONMixin
+import orjson
+from mashumaro.config import BaseConfig
+from mashumaro.exceptions import MissingField
+from mashumaro.mixins.orjson import DataClassORJSONMixin
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
 
-@dataclass
-class AirPressure(DataClassJSONMixin):
+_StrEnumT = TypeVar("_StrEnumT", bound=StrEnum)
+
+
+def _enum_by_value(members: Iterable[_StrEnumT]) -> Callable[[str], _StrEnumT]:
+    """Return a deserializer that looks up members by value.
+
+    members is usually the enum class itself. A plain dict lookup is much cheaper
+    than calling the enum class, and unknown values still fail since they raise KeyError.
+    """
+    return {member.value: member for member in members}.__getitem__
+
+
+def _codes_by_member(enum_type: type[_StrEnumT]) -> dict[_StrEnumT, int]:
+    """Return the integer code of each enum_type member, its index in the enum."""
+    return {member: code for code, member in enumerate(enum_type)}
+
+
+@dataclass(slots=True)
+class AirPressure(DataClassORJSONMixin):
     """Represents the atmospheric air pressure conditions."""
 
-    mean_sea_level_millibars: float = field(metadata={"alias": "meanSeaLevelMillibars"})
+    mean_sea_level_millibars: float
     """The mean sea level air pressure in millibars."""
 
+    class Config(BaseConfig):
+        """Mashumaro configuration."""
 
-@dataclass
-class Interval(DataClassJSONMixin):
+        aliases = MappingProxyType(
+            {
+                "mean_sea_level_millibars": "meanSeaLevelMillibars",
+            }
+        )
+
+
+@dataclass(slots=True)
+class Interval(DataClassORJSONMixin):
     """Represents a time interval."""
 
-    start_time: str = field(metadata={"alias": "startTime"})
+    start_time: str
     """Inclusive start of the interval in RFC 3339 format."""
 
-    end_time: str | None = field(default=None, metadata={"alias": "endTime"})
+    end_time: str | None = None
     """Optional. Exclusive end of the interval in RFC 3339 format."""
 
+    class Config(BaseConfig):
+        """Mashumaro configuration."""
+
+        aliases = MappingProxyType(
+            {
+                "start_time": "startTime",
+                "end_time": "endTime",
+            }
+        )
 
-@dataclass
-class TimeZone(DataClassJSONMixin):
+
+@dataclass(slots=True, frozen=True, weakref_slot=True)
+class TimeZone(DataClassORJSONMixin):
     """Represents a time zone from the IANA Time Zone Database."""
 
-    id: str
+    id: str = field(metadata={"deserialize": sys.intern})
     """IANA Time Zone Database time zone. For example "America/New_York"."""
 
-    version: str | None = None
+    version: str | None = field(default=None, metadata={"deserialize": sys.intern})
     """Optional. IANA Time Zone Database version number. For example "2019a"."""
 
+    @classmethod
+    def __post_deserialize__(cls, obj: TimeZone) -> TimeZone:
+        """Share a single instance per time zone across all decoded responses."""
+        return _TIME_ZONES.setdefault((obj.id, obj.version), obj)
+
+
+_TIME_ZONES: WeakValueDictionary[tuple[str, str | None], TimeZone] = WeakValueDictionary()
 
-@dataclass
-class LocalizedText(DataClassJSONMixin):
+
+@dataclass(slots=True)
+class LocalizedText(DataClassORJSONMixin):
     """Localized variant of a text in a particular language."""
 
-    text: str
+    text: str = field(metadata={"deserialize": sys.intern})
     """Localized string in the language corresponding to languageCode below."""
 
-    language_code: str = field(metadata={"alias": "languageCode"})
+    language_code: str = field(metadata={"deserialize": sys.intern})
     """The text's BCP-47 language code, such as "en-US" or "sr-Latn"."""
 
+    class Config(BaseConfig):
+        """Mashumaro configuration."""
+
+        aliases = MappingProxyType(
+            {
+                "language_code": "languageCode",
+            }
+        )
+
 
-@dataclass
-class Temperature(DataClassJSONMixin):
+@dataclass(slots=True)
+class Temperature(DataClassORJSONMixin):
     """Represents a temperature value."""
 
     class TemperatureUnit(StrEnum):
@@ -63,30 +126,44 @@ class Temperature(DataClassJSONMixin):
     degrees: float
     """The temperature value (in degrees) in the specified unit."""
 
-    unit: TemperatureUnit
+    unit: TemperatureUnit = field(metadata={"deserialize": _enum_by_value(TemperatureUnit)})
     """The code for the unit used to measure the temperature value."""
 
 
-@dataclass
-class QuantitativePrecipitationForecast(DataClassJSONMixin):
-    """Represents the expected amount of melted precipitation."""
+class LengthUnit(StrEnum):
+    """Represents the unit used to measure a precipitation amount, ice thickness, or visibility distance.
+
+    Precipitation amounts and ice thickness are only decoded with MILLIMETERS or INCHES,
+    visibility distances only with KILOMETERS or MILES.
+    """
+
+    UNIT_UNSPECIFIED = "UNIT_UNSPECIFIED"
+    MILLIMETERS = "MILLIMETERS"
+    INCHES = "INCHES"
+    KILOMETERS = "KILOMETERS"
+    MILES = "MILES"
 
-    class Unit(StrEnum):
-        """Represents the unit used to measure the amount of accumulated precipitation."""
 
-        UNIT_UNSPECIFIED = "UNIT_UNSPECIFIED"
-        MILLIMETERS = "MILLIMETERS"
-        INCHES = "INCHES"
+# Each length-valued field only accepts the units the API documents for it.
+_AMOUNT_UNITS = (LengthUnit.UNIT_UNSPECIFIED, LengthUnit.MILLIMETERS, LengthUnit.INCHES)
+_DISTANCE_UNITS = (LengthUnit.UNIT_UNSPECIFIED, LengthUnit.KILOMETERS, LengthUnit.MILES)
+
+
+@dataclass(slots=True)
+class QuantitativePrecipitationForecast(DataClassORJSONMixin):
+    """Represents the expected amount of melted precipitation."""
+
+    Unit = LengthUnit
 
     quantity: float
     """The amount of precipitation, measured as liquid water equivalent."""
 
-    unit: Unit
+    unit: LengthUnit = field(metadata={"deserialize": _enum_by_value(_AMOUNT_UNITS)})
     """The code of the unit used to measure the amount of accumulated precipitation."""
 
 
-@dataclass
-class PrecipitationProbability(DataClassJSONMixin):
+@dataclass(slots=True)
+class PrecipitationProbability(DataClassORJSONMixin):
     """Represents the probability of precipitation at a given location."""
 
     class PrecipitationType(StrEnum):
@@ -102,15 +179,15 @@ class PrecipitationProbability(DataClassJSONMixin):
         SLEET = "SLEET"
         FREEZING_RAIN = "FREEZING_RAIN"
 
-    type: PrecipitationType
+    type: PrecipitationType = field(metadata={"deserialize": _enum_by_value(PrecipitationType)})
     """A code that indicates the type of precipitation."""
 
     percent: int
     """A percentage from 0 to 100 that indicates the chances of precipitation."""
 
 
-@dataclass
-class Precipitation(DataClassJSONMixin):
+@dataclass(slots=True)
+class Precipitation(DataClassORJSONMixin):
     """Represents a set of precipitation values at a given location."""
 
     probability: PrecipitationProbability
@@ -119,12 +196,21 @@ class Precipitation(DataClassJSONMixin):
     qpf: QuantitativePrecipitationForecast
     """The amount of precipitation (rain or snow), measured as liquid water."""
 
-    snow_qpf: QuantitativePrecipitationForecast | None = field(default=None, metadata={"alias": "snowQpf"})
+    snow_qpf: QuantitativePrecipitationForecast | None = None
     """The amount of snow accumulation, measured as liquid water equivalent."""
 
+    class Config(BaseConfig):
+        """Mashumaro configuration."""
+
+        aliases = MappingProxyType(
+            {
+                "snow_qpf": "snowQpf",
+            }
+        )
+
 
-@dataclass
-class WindSpeed(DataClassJSONMixin):
+@dataclass(slots=True)
+class WindSpeed(DataClassORJSONMixin):
     """Represents the speed of the wind."""
 
     class SpeedUnit(StrEnum):
@@ -137,12 +223,12 @@ class WindSpeed(DataClassJSONMixin):
     value: float
     """The value of the wind speed."""
 
-    unit: SpeedUnit
+    unit: SpeedUnit = field(metadata={"deserialize": _enum_by_value(SpeedUnit)})
     """The code that represents the unit used to measure the wind speed."""
 
 
-@dataclass
-class WindDirection(DataClassJSONMixin):
+@dataclass(slots=True)
+class WindDirection(DataClassORJSONMixin):
     """Represents the direction from which the wind originates."""
 
     class CardinalDirection(StrEnum):
@@ -169,12 +255,15 @@ class WindDirection(DataClassJSONMixin):
     degrees: int
     """The direction of the wind in degrees (values from 0 to 360)."""
 
-    cardinal: CardinalDirection
+    cardinal: CardinalDirection = field(metadata={"deserialize": _enum_by_value(CardinalDirection)})
     """The code that represents the cardinal direction from which the wind is blowing."""
 
 
-@dataclass
-class Wind(DataClassJSONMixin):
+_CARDINAL_DIRECTION_CODES = _codes_by_member(WindDirection.CardinalDirection)
+
+
+@dataclass(slots=True)
+class Wind(DataClassORJSONMixin):
     """Represents a set of wind properties."""
 
     direction: WindDirection
@@ -187,26 +276,21 @@ class Wind(DataClassJSONMixin):
     """The wind gust (sudden increase in the wind speed)."""
 
 
-@dataclass
-class Visibility(DataClassJSONMixin):
+@dataclass(slots=True)
+class Visibility(DataClassORJSONMixin):
     """Represents visibility conditions, the distance at which objects can be discerned."""
 
-    class Unit(StrEnum):
-        """Represents the unit used to measure the visibility distance."""
-
-        UNIT_UNSPECIFIED = "UNIT_UNSPECIFIED"
-        KILOMETERS = "KILOMETERS"
-        MILES = "MILES"
+    Unit = LengthUnit
 
     distance: float
     """The visibility distance in the specified unit."""
 
-    unit: Unit
+    unit: LengthUnit = field(metadata={"deserialize": _enum_by_value(_DISTANCE_UNITS)})
     """The code that represents the unit used to measure the distance."""
 
 
-@dataclass
-class WeatherCondition(DataClassJSONMixin):
+@dataclass(slots=True)
+class WeatherCondition(DataClassORJSONMixin):
     """Represents a weather condition for a given location at a given period of time."""
 
     class Type(StrEnum):
@@ -254,83 +338,101 @@ class WeatherCondition(DataClassJSONMixin):
         SCATTERED_THUNDERSTORMS = "SCATTERED_THUNDERSTORMS"
         HEAVY_THUNDERSTORM = "HEAVY_THUNDERSTORM"
 
-    icon_base_uri: str = field(metadata={"alias": "iconBaseUri"})
+    icon_base_uri: str = field(metadata={"deserialize": sys.intern})
     """The base URI for the icon not including the file type extension."""
 
     description: LocalizedText
     """The textual description for this weather condition (localized)."""
 
-    type: Type
+    type: Type = field(metadata={"deserialize": _enum_by_value(Type)})
     """The type of weather condition."""
 
+    class Config(BaseConfig):
+        """Mashumaro configuration."""
 
-@dataclass
-class IceThickness(DataClassJSONMixin):
-    """Represents ice thickness conditions."""
+        aliases = MappingProxyType(
+            {
+                "icon_base_uri": "iconBaseUri",
+            }
+        )
+
+
+_WEATHER_CONDITION_TYPE_CODES = _codes_by_member(WeatherCondition.Type)
 
-    class Unit(StrEnum):
-        """Represents the unit used to measure the ice thickness."""
 
-        UNIT_UNSPECIFIED = "UNIT_UNSPECIFIED"
-        MILLIMETERS = "MILLIMETERS"
-        INCHES = "INCHES"
+@dataclass(slots=True)
+class IceThickness(DataClassORJSONMixin):
+    """Represents ice thickness conditions."""
+
+    Unit = LengthUnit
 
     thickness: float
     """The ice thickness value."""
 
-    unit: Unit
+    unit: LengthUnit = field(metadata={"deserialize": _enum_by_value(_AMOUNT_UNITS)})
     """The code that represents the unit used to measure the ice thickness."""
 
 
-@dataclass
-class CurrentConditionsHistory(DataClassJSONMixin):
+@dataclass(slots=True)
+class CurrentConditionsHistory(DataClassORJSONMixin):
     """Represents a set of changes in the current conditions over the last 24 hours."""
 
-    temperature_change: Temperature = field(metadata={"alias": "temperatureChange"})
+    temperature_change: Temperature
     """The current temperature minus the temperature 24 hours ago."""
 
-    max_temperature: Temperature = field(metadata={"alias": "maxTemperature"})
+    max_temperature: Temperature
     """The maximum (high) temperature in the past 24 hours."""
 
-    min_temperature: Temperature = field(metadata={"alias": "minTemperature"})
+    min_temperature: Temperature
     """The minimum (low) temperature in the past 24 hours."""
 
     qpf: QuantitativePrecipitationForecast
     """The amount of precipitation (rain or snow) accumulated over the last 24 hours."""
 
+    class Config(BaseConfig):
+        """Mashumaro configuration."""
+
+        aliases = MappingProxyType(
+            {
+                "temperature_change": "temperatureChange",
+                "max_temperature": "maxTemperature",
+                "min_temperature": "minTemperature",
+            }
+        )
 
-@dataclass
-class CurrentConditionsResponse(DataClassJSONMixin):
+
+@dataclass(slots=True)
+class CurrentConditionsResponse(DataClassORJSONMixin):
     """Response model for the currentConditions.lookup method."""
 
-    current_time: str = field(metadata={"alias": "currentTime"})
+    current_time: str
     """Current time (UTC) associated with the returned data."""
 
-    time_zone: TimeZone = field(metadata={"alias": "timeZone"})
+    time_zone: TimeZone
     """The time zone at the requested location."""
 
-    weather_condition: WeatherCondition = field(metadata={"alias": "weatherCondition"})
+    weather_condition: WeatherCondition
     """The current weather condition."""
 
     temperature: Temperature
     """The current temperature."""
 
-    feels_like_temperature: Temperature = field(metadata={"alias": "feelsLikeTemperature"})
+    feels_like_temperature: Temperature
     """The measure of how the temperature currently feels like."""
 
-    dew_point: Temperature = field(metadata={"alias": "dewPoint"})
+    dew_point: Temperature
     """The current dew point temperature."""
 
-    heat_index: Temperature = field(metadata={"alias": "heatIndex"})
+    heat_index: Temperature
     """The current heat index temperature."""
 
-    wind_chill: Temperature = field(metadata={"alias": "windChill"})
+    wind_chill: Temperature
     """The current wind chill, air temperature exposed on the skin."""
 
     precipitation: Precipitation
     """Current precipitation probability and accumulated amount over the last hour."""
 
-    air_pressure: AirPressure = field(metadata={"alias": "airPressure"})
+    air_pressure: AirPressure
     """The current air pressure conditions."""
 
     wind: Wind
@@ -339,27 +441,121 @@ class CurrentConditionsResponse(DataClassJSONMixin):
     visibility: Visibility
     """The current visibility."""
 
-    current_conditions_history: CurrentConditionsHistory = field(metadata={"alias": "currentConditionsHistory"})
+    current_conditions_history: CurrentConditionsHistory
     """The changes in the current conditions over the last 24 hours."""
 
-    is_daytime: bool = field(metadata={"alias": "isDaytime"})
+    is_daytime: bool
     """True if the current time is between local sunrise (inclusive) and sunset."""
 
-    relative_humidity: int = field(metadata={"alias": "relativeHumidity"})
+    relative_humidity: int
     """The current percent of relative humidity (0-100)."""
 
-    uv_index: int = field(metadata={"alias": "uvIndex"})
+    uv_index: int
     """The current ultraviolet (UV) index."""
 
-    thunderstorm_probability: int = field(metadata={"alias": "thunderstormProbability"})
+    thunderstorm_probability: int
     """The current thunderstorm probability (0-100)."""
 
-    cloud_cover: int = field(metadata={"alias": "cloudCover"})
+    cloud_cover: int
     """The current percentage of the sky covered by clouds (0-100)."""
 
-
-@dataclass
-class Date(DataClassJSONMixin):
+    class Config(BaseConfig):
+        """Mashumaro configuration."""
+
+        aliases = MappingProxyType(
+            {
+                "current_time": "currentTime",
+                "time_zone": "timeZone",
+                "weather_condition": "weatherCondition",
+                "feels_like_temperature": "feelsLikeTemperature",
+                "dew_point": "dewPoint",
+                "heat_index": "heatIndex",
+                "wind_chill": "windChill",
+                "air_pressure": "airPressure",
+                "current_conditions_history": "currentConditionsHistory",
+                "is_daytime": "isDaytime",
+                "relative_humidity": "relativeHumidity",
+                "uv_index": "uvIndex",
+                "thunderstorm_probability": "thunderstormProbability",
+                "cloud_cover": "cloudCover",
+            }
+        )
+
+
+def _current_conditions_fields() -> dict[str, tuple[str, Callable[[Any], Any] | None]]:
+    """Map each CurrentConditionsResponse field to its JSON key and, for nested models, their from_dict."""
+    hints = get_type_hints(CurrentConditionsResponse)
+    aliases: Mapping[str, Any] = CurrentConditionsResponse.Config.aliases
+    decoders: dict[str, tuple[str, Callable[[Any], Any] | None]] = {}
+    for model_field in fields(CurrentConditionsResponse):
+        hint = hints[model_field.name]
+        decode = hint.from_dict if isinstance(hint, type) and issubclass(hint, DataClassORJSONMixin) else None
+        decoders[model_field.name] = (aliases.get(model_field.name, model_field.name), decode)
+    return decoders
+
+
+_CURRENT_CONDITIONS_FIELDS = _current_conditions_fields()
+
+
+class LazyCurrentConditionsResponse:
+    """Lazily decoded variant of CurrentConditionsResponse.
+
+    The raw response is parsed once and each attribute is only converted into its
+    model when first accessed, which is cheaper when only a few fields are read.
+    Attributes have the same names and types as in CurrentConditionsResponse,
+    a field missing from the response raises MissingField when accessed.
+    """
+
+    __slots__ = ("_data", "_values")
+
+    if TYPE_CHECKING:
+        current_time: str
+        time_zone: TimeZone
+        weather_condition: WeatherCondition
+        temperature: Temperature
+        feels_like_temperature: Temperature
+        dew_point: Temperature
+        heat_index: Temperature
+        wind_chill: Temperature
+        precipitation: Precipitation
+        air_pressure: AirPressure
+        wind: Wind
+        visibility: Visibility
+        current_conditions_history: CurrentConditionsHistory
+        is_daytime: bool
+        relative_humidity: int
+        uv_index: int
+        thunderstorm_probability: int
+        cloud_cover: int
+
+    def __init__(self, raw: bytes | str) -> None:
+        """Initialize from the raw JSON of a currentConditions.lookup response."""
+        self._data: dict[str, Any] = orjson.loads(raw)
+        self._values: dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        """Decode the named field from the raw response on first access."""
+        if name not in _CURRENT_CONDITIONS_FIELDS:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        if name in self._values:
+            return self._values[name]
+        key, decode = _CURRENT_CONDITIONS_FIELDS[name]
+        try:
+            value = self._data[key]
+        except KeyError:
+            raise MissingField(name, get_type_hints(CurrentConditionsResponse)[name], CurrentConditionsResponse) from None
+        if decode is not None:
+            value = decode(value)
+        self._values[name] = value
+        return value
+
+    def to_response(self) -> CurrentConditionsResponse:
+        """Decode the whole response into a CurrentConditionsResponse."""
+        return CurrentConditionsResponse.from_dict(self._data)
+
+
+@dataclass(slots=True)
+class Date(DataClassORJSONMixin):
     """Represents a whole or partial calendar date."""
 
     year: int
@@ -372,14 +568,14 @@ class Date(DataClassJSONMixin):
     """Day of a month. Must be from 1 to 31, or 0."""
 
 
-@dataclass
-class ForecastDayPart(DataClassJSONMixin):
+@dataclass(slots=True)
+class ForecastDayPart(DataClassORJSONMixin):
     """Represents a forecast record for a part of the day (daytime or nighttime)."""
 
     interval: Interval
     """The UTC date and time when this part of the day starts and ends."""
 
-    weather_condition: WeatherCondition = field(metadata={"alias": "weatherCondition"})
+    weather_condition: WeatherCondition
     """The forecasted weather condition."""
 
     precipitation: Precipitation
@@ -388,35 +584,59 @@ class ForecastDayPart(DataClassJSONMixin):
     wind: Wind
     """The average wind direction and maximum speed and gust."""
 
-    relative_humidity: int = field(metadata={"alias": "relativeHumidity"})
+    relative_humidity: int
     """The forecasted percent of relative humidity (0-100)."""
 
-    uv_index: int = field(metadata={"alias": "uvIndex"})
+    uv_index: int
     """The maximum forecasted ultraviolet (UV) index."""
 
-    thunderstorm_probability: int = field(metadata={"alias": "thunderstormProbability"})
+    thunderstorm_probability: int
     """The average thunderstorm probability."""
 
-    cloud_cover: int = field(metadata={"alias": "cloudCover"})
+    cloud_cover: int
     """Average cloud cover percent."""
 
-    ice_thickness: IceThickness | None = field(default=None, metadata={"alias": "iceThickness"})
+    ice_thickness: IceThickness | None = None
     """The forecasted ice thickness."""
 
+    class Config(BaseConfig):
+        """Mashumaro configuration."""
+
+        aliases = MappingProxyType(
+            {
+                "weather_condition": "weatherCondition",
+                "relative_humidity": "relativeHumidity",
+                "uv_index": "uvIndex",
+                "thunderstorm_probability": "thunderstormProbability",
+                "cloud_cover": "cloudCover",
+                "ice_thickness": "iceThickness",
+            }
+        )
 
-@dataclass
-class SunEvents(DataClassJSONMixin):
+
+@dataclass(slots=True)
+class SunEvents(DataClassORJSONMixin):
     """Represents the events related to the sun (e.g. sunrise, sunset)."""
 
-    sunrise_time: str | None = field(default=None, metadata={"alias": "sunriseTime"})
+    sunrise_time: str | None = None
     """The time when the sun rises. Unset in polar regions."""
 
-    sunset_time: str | None = field(default=None, metadata={"alias": "sunsetTime"})
+    sunset_time: str | None = None
     """The time when the sun sets. Unset in polar regions."""
 
+    class Config(BaseConfig):
+        """Mashumaro configuration."""
+
+        aliases = MappingProxyType(
+            {
+                "sunrise_time": "sunriseTime",
+                "sunset_time": "sunsetTime",
+            }
+        )
+
 
-@dataclass
-class MoonEvents(DataClassJSONMixin):
+@dataclass(slots=True)
+class MoonEvents(DataClassORJSONMixin):
     """Represents the events related to the moon (e.g. moonrise, moonset)."""
 
     class MoonPhase(StrEnum):
@@ -432,73 +652,114 @@ class MoonEvents(DataClassJSONMixin):
         LAST_QUARTER = "LAST_QUARTER"
         WANING_CRESCENT = "WANING_CRESCENT"
 
-    moon_phase: MoonPhase = field(metadata={"alias": "moonPhase"})
+    moon_phase: MoonPhase = field(metadata={"deserialize": _enum_by_value(MoonPhase)})
     """The moon phase (a.k.a. lunar phase)."""
 
-    moonrise_times: list[str] = field(default_factory=list, metadata={"alias": "moonriseTimes"})
+    moonrise_times: tuple[str, ...] = ()
     """The time(s) when the upper limb of the moon appears above the horizon."""
 
-    moonset_times: list[str] = field(default_factory=list, metadata={"alias": "moonsetTimes"})
+    moonset_times: tuple[str, ...] = ()
     """The time(s) when the upper limb of the moon disappears below the horizon."""
 
+    class Config(BaseConfig):
+        """Mashumaro configuration."""
 
-@dataclass
-class ForecastDay(DataClassJSONMixin):
+        aliases = MappingProxyType(
+            {
+                "moon_phase": "moonPhase",
+                "moonrise_times": "moonriseTimes",
+                "moonset_times": "moonsetTimes",
+            }
+        )
+
+
+@dataclass(slots=True)
+class ForecastDay(DataClassORJSONMixin):
     """Represents a daily forecast record at a given location."""
 
     interval: Interval
     """The UTC time interval when this forecasted day starts and ends."""
 
-    display_date: Date = field(metadata={"alias": "displayDate"})
+    display_date: Date
     """The local date in the time zone of the location."""
 
-    daytime_forecast: ForecastDayPart = field(metadata={"alias": "daytimeForecast"})
+    daytime_forecast: ForecastDayPart
     """The forecasted weather conditions for the daytime part of the day."""
 
-    nighttime_forecast: ForecastDayPart = field(metadata={"alias": "nighttimeForecast"})
+    nighttime_forecast: ForecastDayPart
     """The forecasted weather conditions for the nighttime part of the day."""
 
-    max_temperature: Temperature = field(metadata={"alias": "maxTemperature"})
+    max_temperature: Temperature
     """The maximum (high) temperature throughout the day."""
 
-    min_temperature: Temperature = field(metadata={"alias": "minTemperature"})
+    min_temperature: Temperature
     """The minimum (low) temperature throughout the day."""
 
-    feels_like_max_temperature: Temperature = field(metadata={"alias": "feelsLikeMaxTemperature"})
+    feels_like_max_temperature: Temperature
     """The maximum (high) feels-like temperature throughout the day."""
 
-    feels_like_min_temperature: Temperature = field(metadata={"alias": "feelsLikeMinTemperature"})
+    feels_like_min_temperature: Temperature
     """The minimum (low) feels-like temperature throughout the day."""
 
-    max_heat_index: Temperature = field(metadata={"alias": "maxHeatIndex"})
+    max_heat_index: Temperature
     """The maximum heat index temperature throughout the day."""
 
-    sun_events: SunEvents = field(metadata={"alias": "sunEvents"})
+    sun_events: SunEvents
     """The events related to the sun (e.g. sunrise, sunset)."""
 
-    moon_events: MoonEvents = field(metadata={"alias": "moonEvents"})
+    moon_events: MoonEvents
     """The events related to the moon (e.g. moonrise, moonset)."""
 
-    ice_thickness: IceThickness | None = field(default=None, metadata={"alias": "iceThickness"})
+    ice_thickness: IceThickness | None = None
     """The accumulated amount of ice throughout the entire day."""
 
-
-@dataclass
-class DailyForecastResponse(DataClassJSONMixin):
+    class Config(BaseConfig):
+        """Mashumaro configuration."""
+
+        aliases = MappingProxyType(
+            {
+                "display_date": "displayDate",
+                "daytime_forecast": "daytimeForecast",
+                "nighttime_forecast": "nighttimeForecast",
+                "max_temperature": "maxTemperature",
+                "min_temperature": "minTemperature",
+                "feels_like_max_temperature": "feelsLikeMaxTemperature",
+                "feels_like_min_temperature": "feelsLikeMinTemperature",
+                "max_heat_index": "maxHeatIndex",
+                "sun_events": "sunEvents",
+                "moon_events": "moonEvents",
+                "ice_thickness": "iceThickness",
+            }
+        )
+
+
+@dataclass(slots=True)
+class DailyForecastResponse(DataClassORJSONMixin):
     """Response model for the forecast.days.lookup method."""
 
-    forecast_days: list[ForecastDay] = field(metadata={"alias": "forecastDays"})
+    forecast_days: list[ForecastDay]
     """The daily forecast records."""
 
-    time_zone: TimeZone = field(metadata={"alias": "timeZone"})
+    time_zone: TimeZone
     """The time zone at the requested location."""
 
-    next_page_token: str | None = field(default=None, metadata={"alias": "nextPageToken"})
+    next_page_token: str | None = None
     """The token to retrieve the next page."""
 
+    class Config(BaseConfig):
+        """Mashumaro configuration."""
 
-@dataclass
-class DateTime(DataClassJSONMixin):
+        aliases = MappingProxyType(
+            {
+                "forecast_days": "forecastDays",
+                "time_zone": "timeZone",
+                "next_page_token": "nextPageToken",
+            }
+        )
+
+
+@dataclass(slots=True)
+class DateTime(DataClassORJSONMixin):
     """Represents civil time (or occasionally physical time)."""
 
     year: int | None = None
@@ -522,48 +783,58 @@ class DateTime(DataClassJSONMixin):
     nanos: int | None = None
     """Optional. Fractions of seconds in nanoseconds."""
 
-    utc_offset: str | None = field(default=None, metadata={"alias": "utcOffset"})
+    utc_offset: str | None = field(default=None, metadata={"deserialize": sys.intern})
     """Optional. UTC offset. Must be whole seconds, between -18 and +18 hours."""
 
-    time_zone: TimeZone | None = field(default=None, metadata={"alias": "timeZone"})
+    time_zone: TimeZone | None = None
     """Optional. Time zone."""
 
+    class Config(BaseConfig):
+        """Mashumaro configuration."""
+
+        aliases = MappingProxyType(
+            {
+                "utc_offset": "utcOffset",
+                "time_zone": "timeZone",
+            }
+        )
 
-@dataclass
-class ForecastHour(DataClassJSONMixin):
+
+@dataclass(slots=True)
+class ForecastHour(DataClassORJSONMixin):
     """Represents an hourly forecast record at a given location."""
 
     interval: Interval
     """The one hour interval (in UTC time) this forecast data is valid for."""
 
-    display_date_time: DateTime = field(metadata={"alias": "displayDateTime"})
+    display_date_time: DateTime
     """The local date and time in the time zone of the location."""
 
-    weather_condition: WeatherCondition = field(metadata={"alias": "weatherCondition"})
+    weather_condition: WeatherCondition
     """The forecasted weather condition."""
 
     temperature: Temperature
     """The forecasted temperature."""
 
-    feels_like_temperature: Temperature = field(metadata={"alias": "feelsLikeTemperature"})
+    feels_like_temperature: Temperature
     """The measure of how the temperature will feel like."""
 
-    dew_point: Temperature = field(metadata={"alias": "dewPoint"})
+    dew_point: Temperature
     """The forecasted dew point temperature."""
 
-    heat_index: Temperature = field(metadata={"alias": "heatIndex"})
+    heat_index: Temperature
     """The forecasted heat index temperature."""
 
-    wind_chill: Temperature = field(metadata={"alias": "windChill"})
+    wind_chill: Temperature
     """The forecasted wind chill, air temperature exposed on the skin."""
 
-    wet_bulb_temperature: Temperature = field(metadata={"alias": "wetBulbTemperature"})
+    wet_bulb_temperature: Temperature
     """The forecasted wet bulb temperature, lowest temperature achievable by evaporating water."""
 
     precipitation: Precipitation
     """The forecasted precipitation probability and amount over the last hour."""
 
-    air_pressure: AirPressure = field(metadata={"alias": "airPressure"})
+    air_pressure: AirPressure
     """The forecasted air pressure conditions."""
 
     wind: Wind
@@ -572,34 +843,101 @@ class ForecastHour(DataClassJSONMixin):
     visibility: Visibility
     """The forecasted visibility."""
 
-    is_daytime: bool = field(metadata={"alias": "isDaytime"})
+    is_daytime: bool
     """True if this hour is between the local sunrise (inclusive) and sunset."""
 
-    relative_humidity: int = field(metadata={"alias": "relativeHumidity"})
+    relative_humidity: int
     """The forecasted percent of relative humidity (0-100)."""
 
-    uv_index: int = field(metadata={"alias": "uvIndex"})
+    uv_index: int
     """The forecasted ultraviolet (UV) index."""
 
-    thunderstorm_probability: int = field(metadata={"alias": "thunderstormProbability"})
+    thunderstorm_probability: int
     """The forecasted thunderstorm probability (0-100)."""
 
-    cloud_cover: int = field(metadata={"alias": "cloudCover"})
+    cloud_cover: int
     """The forecasted percentage of the sky covered by clouds (0-100)."""
 
-    ice_thickness: IceThickness | None = field(default=None, metadata={"alias": "iceThickness"})
+    ice_thickness: IceThickness | None = None
     """The forecasted ice thickness."""
 
-
-@dataclass
-class HourlyForecastResponse(DataClassJSONMixin):
+    class Config(BaseConfig):
+        """Mashumaro configuration."""
+
+        aliases = MappingProxyType(
+            {
+                "display_date_time": "displayDateTime",
+                "weather_condition": "weatherCondition",
+                "feels_like_temperature": "feelsLikeTemperature",
+                "dew_point": "dewPoint",
+                "heat_index": "heatIndex",
+                "wind_chill": "windChill",
+                "wet_bulb_temperature": "wetBulbTemperature",
+                "air_pressure": "airPressure",
+                "is_daytime": "isDaytime",
+                "relative_humidity": "relativeHumidity",
+                "uv_index": "uvIndex",
+                "thunderstorm_probability": "thunderstormProbability",
+                "cloud_cover": "cloudCover",
+                "ice_thickness": "iceThickness",
+            }
+        )
+
+
+@dataclass(slots=True)
+class HourlyForecastResponse(DataClassORJSONMixin):
     """Response model for the forecast.hours.lookup method."""
 
-    forecast_hours: list[ForecastHour] = field(metadata={"alias": "forecastHours"})
+    forecast_hours: list[ForecastHour]
     """The hourly forecast records."""
 
-    time_zone: TimeZone = field(metadata={"alias": "timeZone"})
+    time_zone: TimeZone
     """The time zone at the requested location."""
 
-    next_page_token: str | None = field(default=None, metadata={"alias": "nextPageToken"})
+    next_page_token: str | None = None
     """The token to retrieve the next page."""
+
+    def as_arrays(self) -> dict[str, array[float] | array[int]]:
+        """Return the numeric fields of forecast_hours as columns, one array per field.
+
+        Each array has one entry per forecast hour, which avoids walking the nested
+        records for aggregations like max() or sum(). Values are stored compactly:
+        measurements as 32-bit floats, percentages and the UV index as unsigned
+        bytes, and wind direction as unsigned 16-bit integers. Enum fields are stored
+        as integer codes, the index of the member in its enum, e.g.
+        list(WeatherCondition.Type)[code]. The arrays support the buffer protocol,
+        so e.g. numpy.frombuffer() can wrap them without copying.
+        """
+        hours = self.forecast_hours
+        return {
+            "weather_condition_type": array("B", [_WEATHER_CONDITION_TYPE_CODES[h.weather_condition.type] for h in hours]),
+            "temperature_degrees": array("f", [h.temperature.degrees for h in hours]),
+            "feels_like_temperature_degrees": array("f", [h.feels_like_temperature.degrees for h in hours]),
+            "dew_point_degrees": array("f", [h.dew_point.degrees for h in hours]),
+            "heat_index_degrees": array("f", [h.heat_index.degrees for h in hours]),
+            "wind_chill_degrees": array("f", [h.wind_chill.degrees for h in hours]),
+            "wet_bulb_temperature_degrees": array("f", [h.wet_bulb_temperature.degrees for h in hours]),
+            "precipitation_probability_percent": array("B", [h.precipitation.probability.percent for h in hours]),
+            "qpf_quantity": array("f", [h.precipitation.qpf.quantity for h in hours]),
+            "air_pressure_mean_sea_level_millibars": array("f", [h.air_pressure.mean_sea_level_millibars for h in hours]),
+            "wind_direction_degrees": array("H", [h.wind.direction.degrees for h in hours]),
+            "wind_direction_cardinal": array("B", [_CARDINAL_DIRECTION_CODES[h.wind.direction.cardinal] for h in hours]),
+            "wind_speed_value": array("f", [h.wind.speed.value for h in hours]),
+            "wind_gust_value": array("f", [h.wind.gust.value for h in hours]),
+            "visibility_distance": array("f", [h.visibility.distance for h in hours]),
+            "relative_humidity": array("B", [h.relative_humidity for h in hours]),
+            "uv_index": array("B", [h.uv_index for h in hours]),
+            "thunderstorm_probability": array("B", [h.thunderstorm_probability for h in hours]),
+            "cloud_cover": array("B", [h.cloud_cover for h in hours]),
+        }
+
+    class Config(BaseConfig):
+        """Mashumaro configuration."""
+
+        aliases = MappingProxyType(
+            {
+                "forecast_hours": "forecastHours",
+                "time_zone": "timeZone",
+                "next_page_token": "nextPageToken",
+            }
+        )
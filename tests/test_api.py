@@ -1,6 +1,75 @@
 """Tests for Google Weather API."""
 
+from dataclasses import fields
+
+import orjson
+import pytest
+from mashumaro.exceptions import MissingField
+
+from google_weather_api import CurrentConditionsResponse, LazyCurrentConditionsResponse
+
+CURRENT_CONDITIONS = {
+    "currentTime": "2025-01-28T22:04:12.025273178Z",
+    "timeZone": {"id": "America/Los_Angeles"},
+    "isDaytime": True,
+    "weatherCondition": {
+        "iconBaseUri": "https://maps.gstatic.com/weather/v1/cloudy",
+        "description": {"text": "Cloudy", "languageCode": "en"},
+        "type": "CLOUDY",
+    },
+    "temperature": {"degrees": 13.7, "unit": "CELSIUS"},
+    "feelsLikeTemperature": {"degrees": 13.1, "unit": "CELSIUS"},
+    "dewPoint": {"degrees": 1.1, "unit": "CELSIUS"},
+    "heatIndex": {"degrees": 13.7, "unit": "CELSIUS"},
+    "windChill": {"degrees": 13.1, "unit": "CELSIUS"},
+    "relativeHumidity": 42,
+    "uvIndex": 1,
+    "precipitation": {"probability": {"type": "RAIN", "percent": 10}, "qpf": {"quantity": 0.1, "unit": "MILLIMETERS"}},
+    "thunderstormProbability": 0,
+    "airPressure": {"meanSeaLevelMillibars": 1019.16},
+    "wind": {
+        "direction": {"degrees": 270, "cardinal": "WEST"},
+        "speed": {"value": 8, "unit": "KILOMETERS_PER_HOUR"},
+        "gust": {"value": 15, "unit": "KILOMETERS_PER_HOUR"},
+    },
+    "visibility": {"distance": 16, "unit": "KILOMETERS"},
+    "cloudCover": 100,
+    "currentConditionsHistory": {
+        "temperatureChange": {"degrees": -0.6, "unit": "CELSIUS"},
+        "maxTemperature": {"degrees": 14.3, "unit": "CELSIUS"},
+        "minTemperature": {"degrees": 3.7, "unit": "CELSIUS"},
+        "qpf": {"quantity": 0.1778, "unit": "MILLIMETERS"},
+    },
+}
+
 
 def test_dummy() -> None:
     """Test dummy."""
     assert True
+
+
+def test_lazy_current_conditions_matches_full_decode() -> None:
+    """Test that lazily decoded fields equal the fully decoded response."""
+    raw = orjson.dumps(CURRENT_CONDITIONS)
+    response = CurrentConditionsResponse.from_json(raw)
+    lazy = LazyCurrentConditionsResponse(raw)
+    for model_field in fields(CurrentConditionsResponse):
+        assert getattr(lazy, model_field.name) == getattr(response, model_field.name)
+    assert lazy.to_response() == response
+
+
+def test_lazy_current_conditions_missing_field() -> None:
+    """Test that a field missing from the response raises MissingField on access."""
+    data = dict(CURRENT_CONDITIONS)
+    del data["uvIndex"]
+    lazy = LazyCurrentConditionsResponse(orjson.dumps(data))
+    assert lazy.cloud_cover == 100
+    with pytest.raises(MissingField):
+        _ = lazy.uv_index
+
+
+def test_lazy_current_conditions_unknown_attribute() -> None:
+    """Test that an unknown attribute raises AttributeError."""
+    lazy = LazyCurrentConditionsResponse(orjson.dumps(CURRENT_CONDITIONS))
+    with pytest.raises(AttributeError):
+        _ = lazy.not_a_field